@@ -18,11 +18,12 @@ import argparse
 import logging
 import pathlib
 import sys
-from functools import cmp_to_key
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
+from matplotlib.figure import Figure
+import orjson
 
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.profile_resolver import ProfileResolver
@@ -49,29 +50,24 @@ class Utilities():
     """Utilities."""
 
     @staticmethod
-    def compare_controls(c0: str, c1: str) -> int:
-        """Compare controls."""
-        if '-' not in c0 or '-' not in c1:
-            if c0 > c1:
-                return 1
-            if c0 < c1:
-                return -1
-            return 0
-        c0_lhs = c0.split('-')[0]
-        c0_rhs = c0.split('-')[1]
-        c1_lhs = c1.split('-')[0]
-        c1_rhs = c1.split('-')[1]
-        if c0_lhs > c1_lhs:
-            return 1
-        if c0_lhs < c1_lhs:
-            return -1
-        f0 = float(c0_rhs)
-        f1 = float(c1_rhs)
-        if f0 > f1:
-            return 1
-        if f0 < f1:
-            return -1
-        return 0
+    @lru_cache(maxsize=None)
+    def control_sort_key(control: str) -> Tuple[str, float]:
+        """Control sort key."""
+        if '-' not in control:
+            return (control, 0.0)
+        parts = control.split('-')
+        return (parts[0], float(parts[1]))
+
+    @staticmethod
+    def positive_int(value: str) -> int:
+        """Positive int argument type."""
+        try:
+            rval = int(value)
+        except ValueError:
+            rval = 0
+        if rval < 1:
+            raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+        return rval
 
 
 class CatalogInsights():
@@ -81,38 +77,47 @@ class CatalogInsights():
         """Initialize."""
         self._base = _base
         self._file = _file
-        if not self._is_catalog():
+        self._catalog = self._read_catalog()
+        if not self._catalog:
             self._catalog = ProfileResolver.get_resolved_profile_catalog(
                 pathlib.Path(self._base),
                 self._file,
             )
-        else:
-            _path = pathlib.Path(self._base) / self._file
-            self._catalog = Catalog.oscal_read(_path)
         self.catalog_interface = CatalogInterface(self._catalog)
         #
         self._analyze()
 
-    def _is_catalog(self) -> bool:
-        """Is catalog test."""
-        rval = True
+    def _read_catalog(self) -> Optional[Catalog]:
+        """Read catalog, None if not a catalog."""
+        _path = pathlib.Path(self._base) / self._file
+        if _path.suffix != '.json':
+            try:
+                return Catalog.oscal_read(_path)
+            except Exception:
+                return None
+        # parse once, the top-level key identifies the model
         try:
-            _path = pathlib.Path(self._base) / self._file
-            Catalog.oscal_read(_path)
+            obj = orjson.loads(_path.read_bytes())
         except Exception:
-            rval = False
-        return rval
+            return None
+        if 'catalog' not in obj:
+            return None
+        return Catalog.parse_obj(obj['catalog'])
 
     def _analyze(self) -> None:
         """Analyze."""
-        ctl_list = []
-        for control in self.catalog_interface.get_all_controls_from_catalog(recurse):
-            ctl_list.append(control.id)
-        self._control_id_list = list(set(ctl_list))
+        controls = self.catalog_interface.get_all_controls_from_catalog(recurse)
+        self._control_id_set = {control.id for control in controls}
 
     def get_controls_count(self):
         """Get controls count."""
-        return len(self._control_id_list)
+        return len(self._control_id_set)
+
+
+@lru_cache(maxsize=32)
+def _load_catalog_insights(_base: str, _file: str) -> CatalogInsights:
+    """Load catalog insights, shared across component definitions."""
+    return CatalogInsights(_base, _file)
 
 
 class ComponentDefinitionInsights():
@@ -130,9 +135,11 @@ class ComponentDefinitionInsights():
         self._map_component_and_control_to_rule = {}
         self._map_validation_rule_to_implementation = {}
         #
-        self._map_component_to_rules_to_checks = {}
+        self._map_rule_to_check = {}
         self._list_validation_rules = []
         self._list_validation_checks = []
+        self._unique_rules = set()
+        self._unique_checks = set()
         #
         self._catalogs = {}
         #
@@ -151,77 +158,64 @@ class ComponentDefinitionInsights():
         """Analyze component of type Validation."""
         if not component.props:
             return
-        rule_set_ids = []
-        if component.title not in self._map_component_to_rules_to_checks:
-            self._map_component_to_rules_to_checks[component.title] = {}
-        for prop in component.props:
-            if prop.remarks in rule_set_ids:
-                continue
-            rule_set_ids.append(prop.remarks)
-        for rule_set_id in rule_set_ids:
-            rule = self._get_prop(component.props, rule_set_id, 'Rule_Id')
+        rules_to_checks = {}
+        rule_sets = self._get_rule_sets(component.props)
+        for rule_set in rule_sets.values():
+            rule = rule_set.get('Rule_Id')
             if rule:
-                implemented = self._get_prop(component.props, rule_set_id, 'Rule_Data_Model_Fact_Type_Id_List')
+                rule = sys.intern(rule)
+                implemented = rule_set.get('Rule_Data_Model_Fact_Type_Id_List')
                 self._map_validation_rule_to_implementation[rule] = implemented
-                check = self._get_prop(component.props, rule_set_id, 'Check_Id')
+                check = rule_set.get('Check_Id')
                 if check:
+                    check = sys.intern(check)
                     self._list_validation_rules.append(rule)
                     self._list_validation_checks.append(check)
-                    self._map_component_to_rules_to_checks[component.title][rule] = check
+                    self._unique_rules.add(rule)
+                    self._unique_checks.add(check)
+                    # last rule set within a component wins
+                    rules_to_checks[rule] = check
+        # first component to check a rule wins
+        for rule, check in rules_to_checks.items():
+            self._map_rule_to_check.setdefault(rule, check)
 
     def analyze_component(self, component: ComponentDefinition) -> None:
         """Analyze component of type not Validation."""
-        self._map_component_to_control[component.title] = self.get_component_controls(component)
-        # control-to-components
-        for control in self._map_component_to_control[component.title]:
-            if control not in self._map_control_to_component:
-                self._map_control_to_component[control] = []
-            if component.title not in self._map_control_to_component[control]:
-                self._map_control_to_component[control].append(component.title)
-        self.analyze_rules(component)
-        self.analyze_catalogs(component)
-
-    def analyze_rules(self, component: ComponentDefinition) -> None:
-        """Analyze rules."""
+        # ids recur across maps and sets, intern them for cheaper hashing and compares
+        title = sys.intern(component.title)
+        controls = set()
         for ci in component.control_implementations:
+            # catalogs
+            if ci.source and ci.source not in self._catalogs:
+                self._catalogs[ci.source] = _load_catalog_insights(self._base, ci.source)
             for ir in ci.implemented_requirements:
+                control_id = sys.intern(ir.control_id)
+                controls.add(control_id)
+                # component-and-control-to-rules
                 rules = self.get_rules(ir.props)
                 if not rules:
                     continue
-                if component.title not in self._map_component_and_control_to_rule:
-                    self._map_component_and_control_to_rule[component.title] = {}
-                if ir.control_id not in self._map_component_and_control_to_rule[component.title]:
-                    self._map_component_and_control_to_rule[component.title][ir.control_id] = []
-                value = self._map_component_and_control_to_rule[component.title][ir.control_id] + rules
-                self._map_component_and_control_to_rule[component.title][ir.control_id] = list(set(value))
-
-    def analyze_catalogs(self, component: ComponentDefinition) -> None:
-        """Analyze catalogs."""
-        for ci in component.control_implementations:
-            if not ci.source:
-                continue
-            if ci.source not in self._catalogs:
-                self._catalogs[ci.source] = CatalogInsights(self._base, ci.source)
-
-    def _get_prop(self, props: List[Property], rule_set_id: str, prop_name: str) -> str:
-        """Get prop from rule set."""
-        rval = None
+                controls_to_rules = self._map_component_and_control_to_rule.setdefault(title, {})
+                controls_to_rules.setdefault(control_id, set()).update(rules)
+        self._map_component_to_control[title] = controls
+        # control-to-components
+        for control in controls:
+            if control not in self._map_control_to_component:
+                self._map_control_to_component[control] = set()
+            self._map_control_to_component[control].add(title)
+
+    def _get_rule_sets(self, props: List[Property]) -> Dict[str, Dict[str, str]]:
+        """Get map of rule set id to prop name to prop value."""
+        rval = {}
         for prop in props:
-            if prop.remarks != rule_set_id:
-                continue
-            if prop.name == prop_name:
-                rval = prop.value
-                break
+            rule_set = rval.setdefault(prop.remarks, {})
+            # first occurrence of a name within a rule set wins
+            rule_set.setdefault(prop.name, prop.value)
         return rval
 
     def get_check_for_rule(self, rule: str) -> str:
         """Get check for rule."""
-        rval = None
-        for component_id in self._map_component_to_rules_to_checks:
-            if rule in self._map_component_to_rules_to_checks[component_id].keys():
-                rval = self._map_component_to_rules_to_checks[component_id][rule]
-                break
-        return rval
+        return self._map_rule_to_check.get(rule)
 
     def get_catalogs_controls_count(self) -> int:
         """Get catalogs controls count."""
@@ -243,24 +237,26 @@ class ComponentDefinitionInsights():
         """Get list of validation checks."""
         return self._list_validation_checks
 
+    def get_unique_rule_count(self) -> int:
+        """Get count of unique validation rules."""
+        return len(self._unique_rules)
+
+    def get_unique_check_count(self) -> int:
+        """Get count of unique validation checks."""
+        return len(self._unique_checks)
+
     def get_rules(self, props: List[Property]) -> List[str]:
         """Get rules."""
         rval = []
         if props:
             for prop in props:
                 if prop.name == 'Rule_Id':
-                    rval.append(prop.value)
+                    rval.append(sys.intern(prop.value))
         return rval
 
     def get_component_controls(self, component: DefinedComponent) -> List[str]:
         """Get components controls."""
-        rval = []
-        for ci in component.control_implementations:
-            for ir in ci.implemented_requirements:
-                control_id = ir.control_id
-                if control_id not in rval:
-                    rval.append(control_id)
-        return rval
+        return sorted(self._map_component_to_control.get(component.title, []), key=Utilities.control_sort_key)
 
     def get_version(self) -> str:
         """Get version."""
@@ -276,7 +272,7 @@ class ComponentDefinitionInsights():
 
     def get_all_controls_sorted(self) -> List[str]:
         """Get all controls sorted."""
-        return sorted(self._map_control_to_component.keys(), key=cmp_to_key(Utilities.compare_controls))
+        return sorted(self._map_control_to_component.keys(), key=Utilities.control_sort_key)
 
     def get_all_components_sorted(self) -> List[str]:
         """Get all components sorted."""
@@ -284,31 +280,28 @@ class ComponentDefinitionInsights():
 
     def get_map_component_to_control(self) -> Dict[str, List[str]]:
         """Get map of components to controls."""
-        return self._map_component_to_control
+        return {
+            component: sorted(controls, key=Utilities.control_sort_key)
+            for component, controls in self._map_component_to_control.items()
+        }
 
     def get_map_control_to_component(self) -> Dict[str, List[str]]:
         """Get map of controls title to components."""
-        return self._map_control_to_component
+        return {control: sorted(components) for control, components in self._map_control_to_component.items()}
 
     def get_map_component_to_control_check_coverage(self) -> Dict[str, List[float]]:
         """Get map of components to controls check coverage."""
         rval = {}
-        for component in self._map_component_and_control_to_rule.keys():
-            pct = 0
-            if component in self.get_all_components_sorted():
-                controls_to_rules = self._map_component_and_control_to_rule[component]
-                count_rules = 0
-                count_checks = 0
-                controls = controls_to_rules.keys()
-                for control in controls:
-                    rules = controls_to_rules[control]
-                    for rule in rules:
-                        count_rules += 1
-                        check = self.get_check_for_rule(rule)
-                        if check:
-                            count_checks += 1
-                pct = count_checks / count_rules * 100
-            rval[component] = pct
+        # only rules with a check are indexed
+        rules_with_checks = self._map_rule_to_check.keys()
+        # components with rules are always among the analyzed components
+        for component, controls_to_rules in self._map_component_and_control_to_rule.items():
+            count_rules = 0
+            count_checks = 0
+            for rules in controls_to_rules.values():
+                count_rules += len(rules)
+                count_checks += len(rules_with_checks & rules)
+            rval[component] = count_checks / count_rules * 100
         return rval
 
     def get_map_validation_rule_to_implementation(self) -> Dict[str, str]:
@@ -370,10 +363,15 @@ class OscalComponentDefinitionInsights():
         # plots
         self.make_plots(args)
 
-    def get_ticks(self, x_pos: List[int]) -> int:
+    def save_figure(self, args: Dict, fig: Figure, name: str) -> None:
+        """Save figure."""
+        output_file = pathlib.Path(args.output_path) / f'{name}.{args.format}'
+        fig.savefig(f'{output_file}', dpi=args.dpi, format=args.format)
+
+    def get_ticks(self, count: int) -> int:
         """Get ticks."""
         rval = 1
-        ticks = int(len(x_pos) / 10)
+        ticks = int(count / 10)
         if ticks > 1:
             rval = ticks
         return rval
@@ -388,88 +386,74 @@ class OscalComponentDefinitionInsights():
         label02 = f'{self.get_label_controls()} {self.get_label_part_not_covered()} {count_controls}'
         labels = label01, label02
         counts = [count_controls_covered, count_controls]
-        fig, ax = plt.subplots()
+        fig = Figure()
+        ax = fig.subplots()
         fig.patch.set_facecolor('wheat')
         ax.pie(counts, labels=labels, colors=colors, wedgeprops=wedgeprops, autopct='%1.0f%%')
-        output_file = pathlib.Path(args.output_path) / 'controls-coverage.png'
-        plt.savefig(f'{output_file}', dpi=400)
-
-    def make_plot_02(self, args: Dict) -> None:
-        """Make plot 02."""
-        _map = self.cdi.get_map_control_to_component()
-        keys = self.cdi.get_all_controls_sorted()
-        max_x = 0
-        max_y = 0
-        y_pos = []
-        x_pos = []
-        for key in keys:
-            max_y += 1
-            y_pos.append(key)
-            x_val = len(_map[key])
-            if x_val > max_x:
-                max_x = x_val
-            x_pos.append(x_val)
+        self.save_figure(args, fig, 'controls-coverage')
+
+    def make_plot_barh(
+        self,
+        args: Dict,
+        _map: Dict[str, List[str]],
+        keys: List[str],
+        facecolor: str,
+        xlabel: str,
+        ylabel: str,
+        ticks: int,
+        output_name: str,
+    ) -> (float, float):
+        """Make horizontal bar plot of number of values per key."""
+        y_pos = list(keys)
+        x_pos = [len(_map[key]) for key in y_pos]
+        max_x = max(x_pos, default=0)
+        max_y = len(y_pos)
         w = self.scale(6.4, 30, max_x)
         h = self.scale(4.8, 30, max_y)
-        fig, ax = plt.subplots(figsize=(w, h))
-        fig.patch.set_facecolor('wheat')
+        fig = Figure(figsize=(w, h))
+        ax = fig.subplots()
+        fig.patch.set_facecolor(facecolor)
         t1 = f'version: {self.cdi.get_version()}'
         t2 = f'last modified date: {self.cdi.get_last_modified().date()}'
-        plt.title(f'{t1}', fontsize=10, loc='left')
-        plt.title(f'{t2}', fontsize=10, loc='right')
+        ax.set_title(f'{t1}', fontsize=10, loc='left')
+        ax.set_title(f'{t2}', fontsize=10, loc='right')
         ax.barh(y_pos, x_pos, align='center')
         ax.invert_yaxis()  # labels read top-to-bottom
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_yticklabels(y_pos, fontsize=8)
+        fig.tight_layout()
+        ax.xaxis.set_major_locator(mticker.MultipleLocator(ticks))
+        self.save_figure(args, fig, output_name)
+        return (w, h)
+
+    def make_plot_02(self, args: Dict) -> None:
+        """Make plot 02."""
+        _map = self.cdi.get_map_control_to_component()
+        keys = self.cdi.get_all_controls_sorted()
         count_controls = len(keys)
         count_controls_catalog = self.cdi.get_catalogs_controls_count()
-        ax.set_xlabel(f'{label_number_of_components}')
-        ax.set_ylabel(f'{self.get_label_controls()}: {count_controls} covered of {count_controls_catalog} in catalog')
-        ax.set_yticklabels(y_pos, fontsize=8)
-        plt.tight_layout()
-        ticks = self.get_ticks(x_pos)
-        plt.gca().xaxis.set_major_locator(mticker.MultipleLocator(ticks))
-        output_file = pathlib.Path(args.output_path) / 'controls-to-number-of-components.png'
-        plt.savefig(f'{output_file}', dpi=400)
+        xlabel = f'{label_number_of_components}'
+        ylabel = f'{self.get_label_controls()}: {count_controls} covered of {count_controls_catalog} in catalog'
+        ticks = self.get_ticks(count_controls)
+        output_name = 'controls-to-number-of-components'
+        self.make_plot_barh(args, _map, keys, 'wheat', xlabel, ylabel, ticks, output_name)
 
-    def make_plot_03(self, args: Dict) -> (int, int):
+    def make_plot_03(self, args: Dict) -> (float, float):
         """Make plot 03."""
         _map = self.cdi.get_map_component_to_control()
         keys = _map.keys()
-        max_x = 0
-        max_y = 0
-        y_pos = []
-        x_pos = []
-        for key in keys:
-            max_y += 1
-            y_pos.append(key)
-            x_val = len(_map[key])
-            if x_val > max_x:
-                max_x = x_val
-            x_pos.append(x_val)
-        w = self.scale(6.4, 30, max_x)
-        h = self.scale(4.8, 30, max_y)
-        fig, ax = plt.subplots(figsize=(w, h))
-        fig.patch.set_facecolor('powderblue')
-        t1 = f'version: {self.cdi.get_version()}'
-        t2 = f'last modified date: {self.cdi.get_last_modified().date()}'
-        plt.title(f'{t1}', fontsize=10, loc='left')
-        plt.title(f'{t2}', fontsize=10, loc='right')
-        ax.barh(y_pos, x_pos, align='center')
-        ax.invert_yaxis()  # labels read top-to-bottom
         count_components = len(keys)
-        ax.set_xlabel(f'{self.get_label_number_of_controls()}')
-        ax.set_ylabel(f'Components: {count_components}')
-        ax.set_yticklabels(y_pos, fontsize=8)
-        plt.tight_layout()
-        if len(x_pos) > 20:
+        xlabel = f'{self.get_label_number_of_controls()}'
+        ylabel = f'Components: {count_components}'
+        if count_components > 20:
             ticks = 2
         else:
             ticks = 1
-        plt.gca().xaxis.set_major_locator(mticker.MultipleLocator(ticks))
-        output_file = pathlib.Path(args.output_path) / 'components-to-number-of-controls.png'
-        plt.savefig(f'{output_file}', dpi=400)
-        return (w, h)
+        output_name = 'components-to-number-of-controls'
+        return self.make_plot_barh(args, _map, keys, 'powderblue', xlabel, ylabel, ticks, output_name)
 
-    def make_plot_04(self, args: Dict, w: int, h: int) -> None:
+    def make_plot_04(self, args: Dict, w: float, h: float) -> None:
         """Make plot 04."""
         _map = self.cdi.get_map_component_to_control_check_coverage()
         keys = _map.keys()
@@ -484,50 +468,48 @@ class OscalComponentDefinitionInsights():
             else:
                 color.append(f'{color_good}')
             x_pos.append(x_val)
-        fig, ax = plt.subplots(figsize=(w, h))
+        fig = Figure(figsize=(w, h))
+        ax = fig.subplots()
         fig.patch.set_facecolor('powderblue')
         t1 = f'version: {self.cdi.get_version()}'
         t2 = f'last modified date: {self.cdi.get_last_modified().date()}'
-        plt.title(f'{t1}', fontsize=10, loc='left')
-        plt.title(f'{t2}', fontsize=10, loc='right')
+        ax.set_title(f'{t1}', fontsize=10, loc='left')
+        ax.set_title(f'{t2}', fontsize=10, loc='right')
         ax.barh(y_pos, x_pos, align='center', color=color)
         ax.invert_yaxis()  # labels read top-to-bottom
         count_components = len(keys)
         ax.set_xlabel(f'Percentage of {self.get_label_controls()} with assessment checks')
         ax.set_ylabel(f'Components: {count_components}')
         ax.set_yticklabels(y_pos, fontsize=8)
-        plt.tight_layout()
-        output_file = pathlib.Path(args.output_path) / 'components-to-percentage-of-controls-covered-checks.png'
-        plt.savefig(f'{output_file}', dpi=400)
+        fig.tight_layout()
+        self.save_figure(args, fig, 'components-to-percentage-of-controls-covered-checks')
 
     def make_plot_05(self, args: Dict) -> None:
         """Make plot 05."""
-        v_rules = self.cdi.get_validation_rules()
-        v_rule_count_unique = len(set(v_rules))
-        v_checks = self.cdi.get_validation_checks()
-        v_check_count = len(v_checks)
-        v_check_count_unique = len(set(v_checks))
+        v_rule_count_unique = self.cdi.get_unique_rule_count()
+        v_check_count = len(self.cdi.get_validation_checks())
+        v_check_count_unique = self.cdi.get_unique_check_count()
         v_check_count_reused = v_check_count - v_check_count_unique
         y_pos = ['Rules', 'Assessment Checks (unique)', 'Assessment Checks (re-used)']
         x_pos = [v_rule_count_unique, v_check_count_unique, v_check_count_reused]
         w = 6.4
         h = 4.8
-        fig, ax = plt.subplots(figsize=(w, h))
+        fig = Figure(figsize=(w, h))
+        ax = fig.subplots()
         fig.patch.set_facecolor('thistle')
         t1 = f'version: {self.cdi.get_version()}'
         t2 = f'last modified date: {self.cdi.get_last_modified().date()}'
-        plt.title(f'{t1}', fontsize=10, loc='left')
-        plt.title(f'{t2}', fontsize=10, loc='right')
+        ax.set_title(f'{t1}', fontsize=10, loc='left')
+        ax.set_title(f'{t2}', fontsize=10, loc='right')
         hbars = ax.barh(y_pos, x_pos, align='center')
         ax.invert_yaxis()  # labels read top-to-bottom
         ax.set_xlabel('Count')
         ax.set_yticklabels(y_pos, fontsize=8)
-        plt.tight_layout()
+        fig.tight_layout()
         upper_limit = (max(x_pos) + 50) // 100 * 100 + 100
         ax.bar_label(hbars)
         ax.set_xlim(0, upper_limit)  # adjust xlim to fit labels
-        output_file = pathlib.Path(args.output_path) / 'rules-checks-counts.png'
-        plt.savefig(f'{output_file}', dpi=400)
+        self.save_figure(args, fig, 'rules-checks-counts')
 
     def make_plot_06(self, args: Dict) -> None:
         """Make plot 06."""
@@ -553,11 +535,11 @@ class OscalComponentDefinitionInsights():
             labels = [label02]
             counts = [count_implementation_missing]
             colors = [f'{color_other}']
-        fig, ax = plt.subplots()
+        fig = Figure()
+        ax = fig.subplots()
         fig.patch.set_facecolor('wheat')
         ax.pie(counts, labels=labels, colors=colors, wedgeprops=wedgeprops, autopct='%1.0f%%')
-        output_file = pathlib.Path(args.output_path) / 'implemenations-exist.png'
-        plt.savefig(f'{output_file}', dpi=400)
+        self.save_figure(args, fig, 'implemenations-exist')
 
     def make_plots(self, args: Dict):
         """Make plots."""
@@ -587,6 +569,11 @@ class OscalComponentDefinitionInsights():
         required.add_argument('--file-path', action='store', required=True, help=help_file_path)
         help_output_path = 'output path to folder to contain produced results'
         required.add_argument('--output-path', action='store', required=True, help=help_output_path)
+        help_dpi = 'resolution of produced raster plots, in dots per inch (default: %(default)s)'
+        parser.add_argument('--dpi', action='store', type=Utilities.positive_int, default=150, help=help_dpi)
+        help_format = 'file format of produced plots (default: %(default)s)'
+        choices_format = ['png', 'svg', 'pdf']
+        parser.add_argument('--format', action='store', choices=choices_format, default='png', help=help_format)
         return parser.parse_args()
 
 